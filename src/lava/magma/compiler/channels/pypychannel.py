@@ -122,7 +122,7 @@ class CspSendPort(AbstractCspSendPort):
         if data.shape != self._shape:
             raise AssertionError(f"{data.shape=} {self._shape=} Mismatch")
         self._semaphore.acquire()
-        self._array[self._idx][:] = data[:]
+        self._array[self._idx][:] = data
         self._idx = (self._idx + 1) % self._size
         self._req.release()
 
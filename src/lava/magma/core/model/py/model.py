@@ -15,6 +15,7 @@ from lava.magma.core.model.py.ports import AbstractPyPort, PyVarPort
 from lava.magma.runtime.mgmt_token_enums import (
     enum_to_np,
     enum_equal,
+    to_np,
     MGMT_COMMAND,
     MGMT_RESPONSE, )
 
@@ -48,10 +49,10 @@ class AbstractPyProcessModel(AbstractProcessModel, ABC):
                                                          CspRecvPort],
                                                 ty.Callable]] = []
         self._cmd_handlers: ty.Dict[MGMT_COMMAND, ty.Callable] = {
-            MGMT_COMMAND.STOP[0]: self._stop,
-            MGMT_COMMAND.PAUSE[0]: self._pause,
-            MGMT_COMMAND.GET_DATA[0]: self._get_var,
-            MGMT_COMMAND.SET_DATA[0]: self._set_var
+            MGMT_COMMAND.STOP: self._stop,
+            MGMT_COMMAND.PAUSE: self._pause,
+            MGMT_COMMAND.GET_DATA: self._get_var,
+            MGMT_COMMAND.SET_DATA: self._set_var
         }
 
     def __setattr__(self, key: str, value: ty.Any):
@@ -88,7 +89,7 @@ class AbstractPyProcessModel(AbstractProcessModel, ABC):
         """
         Command handler for Stop command.
         """
-        self.process_to_service.send(MGMT_RESPONSE.TERMINATED)
+        self.process_to_service.send(to_np(MGMT_RESPONSE.TERMINATED))
         self._stopped = True
         self.join()
 
@@ -96,7 +97,7 @@ class AbstractPyProcessModel(AbstractProcessModel, ABC):
         """
         Command handler for Pause command.
         """
-        self.process_to_service.send(MGMT_RESPONSE.PAUSED)
+        self.process_to_service.send(to_np(MGMT_RESPONSE.PAUSED))
 
     def _get_var(self):
         """Handles the get Var command from runtime service."""
@@ -138,7 +139,8 @@ class AbstractPyProcessModel(AbstractProcessModel, ABC):
                 setattr(self, var_name, buffer.item())
             else:
                 setattr(self, var_name, buffer.astype(var.dtype))
-            self.process_to_service.send(MGMT_RESPONSE.SET_COMPLETE)
+            self.process_to_service.send(
+                to_np(MGMT_RESPONSE.SET_COMPLETE))
         elif isinstance(var, np.ndarray):
             # First item is number of items
             num_items = data_port.recv()[0]
@@ -149,9 +151,10 @@ class AbstractPyProcessModel(AbstractProcessModel, ABC):
                     break
                 num_items -= 1
                 i[...] = data_port.recv()[0]
-            self.process_to_service.send(MGMT_RESPONSE.SET_COMPLETE)
+            self.process_to_service.send(
+                to_np(MGMT_RESPONSE.SET_COMPLETE))
         else:
-            self.process_to_service.send(MGMT_RESPONSE.ERROR)
+            self.process_to_service.send(to_np(MGMT_RESPONSE.ERROR))
             raise RuntimeError("Unsupported type")
 
     def _handle_var_port(self, var_port):
@@ -170,7 +173,7 @@ class AbstractPyProcessModel(AbstractProcessModel, ABC):
                 try:
                     if cmd in self._cmd_handlers:
                         self._cmd_handlers[cmd]()
-                        if cmd == MGMT_COMMAND.STOP[0] or self._stopped:
+                        if cmd == MGMT_COMMAND.STOP or self._stopped:
                             return
                     else:
                         raise ValueError(
@@ -180,7 +183,8 @@ class AbstractPyProcessModel(AbstractProcessModel, ABC):
                             f"command: {cmd} ")
                 except Exception as inst:
                     # Inform runtime service about termination
-                    self.process_to_service.send(MGMT_RESPONSE.ERROR)
+                    self.process_to_service.send(
+                        to_np(MGMT_RESPONSE.ERROR))
                     self.join()
                     raise inst
             else:
@@ -435,7 +439,7 @@ class PyAsyncProcessModel(AbstractPyProcessModel):
     def __init__(self, proc_params: ty.Dict[str, ty.Any] = None):
         super(PyAsyncProcessModel, self).__init__(proc_params)
         self._cmd_handlers.update({
-            MGMT_COMMAND.RUN[0]: self._run_async
+            MGMT_COMMAND.RUN: self._run_async
         })
 
     class Response:
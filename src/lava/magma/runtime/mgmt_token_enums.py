@@ -2,73 +2,134 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # See: https://spdx.org/licenses/
 import typing as ty
+from enum import IntEnum, unique
+from functools import lru_cache
+
 import numpy as np
 
 """Defines message tokens for Actions (Commands) and Responses. Also defines
 helper functions to convert scalar values to these message tokens"""
 
 
+@lru_cache(maxsize=128)
+def _enum_to_np_cached(value: int, d_type: type) -> np.ndarray:
+    """Creates the read-only 1-D array cached by enum_to_np."""
+    arr = np.array([value], dtype=d_type)
+    arr.setflags(write=False)
+    return arr
+
+
 def enum_to_np(value: ty.Union[int, float],
                d_type: type = np.float64) -> np.array:
     """
     Helper function to convert an int (or EnumInt) or a float to a single value
     np array so as to pass it via the message passing framework. The dtype of
-    the np array is specified by d_type with the default of np.int32.
+    the np array is specified by d_type with the default of np.float64.
+
+    Recently used integral values (e.g. tokens) are cached by (value, d_type)
+    so that repeated calls do not allocate a new array. Arrays returned for
+    integral values are therefore read-only and shared between callers.
 
     :param value: value to be converted to a 1-D array
     :param d_type: type of the converted np array
     :return: np array with the value
     """
-
+    if isinstance(value, (int, np.integer)):
+        return _enum_to_np_cached(value, d_type)
+    # Other values, such as float Var data, are not cached since the cache
+    # matches keys by equality, which would return a cached 0 for -0.0
     return np.array([value], dtype=d_type)
 
 
-def enum_equal(a: np.array, b: np.array) -> bool:
+def enum_equal(a: ty.Union[int, float, np.array],
+               b: ty.Union[int, float, np.array]) -> bool:
     """
-    Helper function to compare two np arrays created by enum_to_np.
+    Helper function to compare two message tokens. Each token may either be a
+    scalar or a 1-D array created by enum_to_np.
 
-    :param a: 1-D array created by enum_to_np
-    :param b: 1-D array created by enum_to_np
-    :return: True if the two arrays are equal
+    :param a: scalar or 1-D array created by enum_to_np
+    :param b: scalar or 1-D array created by enum_to_np
+    :return: True if the two tokens are equal
     """
-    return a[0] == b[0]
+    if isinstance(a, np.ndarray):
+        a = a[0]
+    if isinstance(b, np.ndarray):
+        b = b[0]
+    return a == b
 
 
-class MGMT_COMMAND:
+def enum_equal_scalar(a: ty.Union[int, float],
+                      b: ty.Union[int, float]) -> bool:
+    """
+    Helper function to compare two scalar message tokens, e.g. the first
+    element of a received message with a MGMT_COMMAND.
+
+    :param a: scalar token
+    :param b: scalar token
+    :return: True if the two tokens are equal
+    """
+    return a == b
+
+
+@unique
+class MGMT_COMMAND(IntEnum):
     """
     Signifies the Mgmt Command being sent between two actors. These may be
     between runtime and runtime_service or the runtime_service
-    and process model.
+    and process model. Commands compare as ints and are converted with
+    to_np when sent via the message passing framework.
     """
 
-    RUN = enum_to_np(0)
+    RUN = 0
     """Signifies a RUN command for 0 timesteps from one actor to another. Any
     non negative integer signifies a run command"""
-    STOP = enum_to_np(-1)
+    STOP = -1
     """Signifies a STOP command from one actor to another"""
-    PAUSE = enum_to_np(-2)
+    PAUSE = -2
     """Signifies a PAUSE command from one actor to another"""
-    GET_DATA = enum_to_np(-3)
+    GET_DATA = -3
     """Signifies Read a variable"""
-    SET_DATA = enum_to_np(-4)
+    SET_DATA = -4
     """Signifies Write a variable"""
 
 
-class MGMT_RESPONSE:
+@unique
+class MGMT_RESPONSE(IntEnum):
     """Signifies the response to a Mgmt command. This response can be sent
-    by any actor upon receiving a Mgmt command"""
+    by any actor upon receiving a Mgmt command. Responses compare as ints and
+    are converted with to_np when sent via the message passing framework."""
 
-    DONE = enum_to_np(0)
+    DONE = 0
     """Signfies Ack or Finished with the Command"""
-    TERMINATED = enum_to_np(-1)
+    TERMINATED = -1
     """Signifies Termination"""
-    ERROR = enum_to_np(-2)
+    ERROR = -2
     """Signifies Error raised"""
-    PAUSED = enum_to_np(-3)
+    PAUSED = -3
     """Signifies Execution State to be Paused"""
-    REQ_PAUSE = enum_to_np(-4)
+    REQ_PAUSE = -4
     """Signifies Request of PAUSE"""
-    REQ_STOP = enum_to_np(-5)
+    REQ_STOP = -5
     """Signifies Request of STOP"""
-    SET_COMPLETE = enum_to_np(-6)
+    SET_COMPLETE = -6
     """Signifies Completion of Set Var"""
+
+
+# One dict per enum, since members of different IntEnums with the same value
+# compare and hash equal
+_token_arrays: ty.Dict[ty.Type[IntEnum], ty.Dict[IntEnum, np.ndarray]] = {
+    enum_type: {token: enum_to_np(int(token)) for token in enum_type}
+    for enum_type in (MGMT_COMMAND, MGMT_RESPONSE)
+}
+
+
+def to_np(token: ty.Union[MGMT_COMMAND, MGMT_RESPONSE]) -> np.ndarray:
+    """
+    Helper function to get the precomputed, read-only 1-D array of a
+    MGMT_COMMAND or MGMT_RESPONSE token to pass it via the message passing
+    framework.
+
+    :param token: MGMT_COMMAND or MGMT_RESPONSE member
+    :return: read-only np array with the value of the token
+    """
+    return _token_arrays[type(token)][token]
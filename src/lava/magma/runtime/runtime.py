@@ -21,7 +21,7 @@ from lava.magma.runtime.message_infrastructure \
     .message_infrastructure_interface \
     import MessageInfrastructureInterface
 from lava.magma.runtime.mgmt_token_enums import enum_to_np, enum_equal, \
-    MGMT_COMMAND, MGMT_RESPONSE
+    to_np, MGMT_COMMAND, MGMT_RESPONSE
 from lava.magma.runtime.runtime_services.runtime_service \
     import AsyncPyRuntimeService
 
@@ -353,7 +353,7 @@ class Runtime:
         """Pauses the execution"""
         if self._is_running:
             for send_port in self.runtime_to_service:
-                send_port.send(MGMT_COMMAND.PAUSE)
+                send_port.send(to_np(MGMT_COMMAND.PAUSE))
             for recv_port in self.service_to_runtime:
                 data = recv_port.recv()
                 if not enum_equal(data, MGMT_RESPONSE.PAUSED):
@@ -378,7 +378,7 @@ class Runtime:
         try:
             if self._is_started:
                 for send_port in self.runtime_to_service:
-                    send_port.send(MGMT_COMMAND.STOP)
+                    send_port.send(to_np(MGMT_COMMAND.STOP))
                 for recv_port in self.service_to_runtime:
                     data = recv_port.recv()
                     if not enum_equal(data, MGMT_RESPONSE.TERMINATED):
@@ -420,7 +420,7 @@ class Runtime:
 
             # 1. Send SET Command
             req_port: CspSendPort = self.runtime_to_service[runtime_srv_id]
-            req_port.send(MGMT_COMMAND.SET_DATA)
+            req_port.send(to_np(MGMT_COMMAND.SET_DATA))
             req_port.send(enum_to_np(model_id))
             req_port.send(enum_to_np(var_id))
 
@@ -469,7 +469,7 @@ class Runtime:
 
             # 1. Send GET Command
             req_port: CspSendPort = self.runtime_to_service[runtime_srv_id]
-            req_port.send(MGMT_COMMAND.GET_DATA)
+            req_port.send(to_np(MGMT_COMMAND.GET_DATA))
             req_port.send(enum_to_np(model_id))
             req_port.send(enum_to_np(var_id))
 
@@ -16,6 +16,7 @@ from lava.magma.core.sync.protocol import AbstractSyncProtocol
 from lava.magma.runtime.mgmt_token_enums import (
     enum_to_np,
     enum_equal,
+    to_np,
     MGMT_RESPONSE,
     MGMT_COMMAND,
 )
@@ -175,16 +176,16 @@ class LoihiPyRuntimeService(PyRuntimeService):
             return LoihiPyRuntimeService.Phase.LRN
         if self.req_pause:
             self.req_pause = False
-            return MGMT_COMMAND.PAUSE
+            return to_np(MGMT_COMMAND.PAUSE)
         if self.req_stop:
             self.req_stop = False
-            return MGMT_COMMAND.STOP
+            return to_np(MGMT_COMMAND.STOP)
 
         if is_last_time_step:
             return LoihiPyRuntimeService.Phase.HOST
         return LoihiPyRuntimeService.Phase.SPK
 
-    def _send_pm_cmd(self, phase: MGMT_COMMAND):
+    def _send_pm_cmd(self, phase: np.ndarray):
         """Sends a command (phase information) to all ProcessModels."""
         for send_port in self.service_to_process:
             send_port.send(phase)
@@ -269,18 +270,18 @@ class LoihiPyRuntimeService(PyRuntimeService):
 
     def _handle_pause(self):
         # Inform all ProcessModels about the PAUSE command
-        self._send_pm_cmd(MGMT_COMMAND.PAUSE)
+        self._send_pm_cmd(to_np(MGMT_COMMAND.PAUSE))
         rsps = self._get_pm_resp()
         for rsp in rsps:
             if not enum_equal(rsp,
                               LoihiPyRuntimeService.PMResponse.STATUS_PAUSED):
                 raise ValueError(f"Wrong Response Received : {rsp}")
         # Inform the runtime about successful pausing
-        self.service_to_runtime.send(MGMT_RESPONSE.PAUSED)
+        self.service_to_runtime.send(to_np(MGMT_RESPONSE.PAUSED))
 
     def _handle_stop(self):
         # Inform all ProcessModels about the STOP command
-        self._send_pm_cmd(MGMT_COMMAND.STOP)
+        self._send_pm_cmd(to_np(MGMT_COMMAND.STOP))
         rsps = self._get_pm_resp()
         for rsp in rsps:
             if not enum_equal(rsp,
@@ -288,7 +289,7 @@ class LoihiPyRuntimeService(PyRuntimeService):
                               ):
                 raise ValueError(f"Wrong Response Received : {rsp}")
         # Inform the runtime about successful termination
-        self.service_to_runtime.send(MGMT_RESPONSE.TERMINATED)
+        self.service_to_runtime.send(to_np(MGMT_RESPONSE.TERMINATED))
         self.join()
 
     def run(self):
@@ -321,21 +322,21 @@ class LoihiPyRuntimeService(PyRuntimeService):
                     self.paused = False
                     # The number of time steps was received ("command")
                     # Start iterating through Loihi phases
+                    num_steps = int(command[0])
                     curr_time_step = 0
                     phase = LoihiPhase.HOST
                     while True:
                         # Check if it is the last time step
-                        is_last_ts = enum_equal(enum_to_np(curr_time_step),
-                                                command)
+                        is_last_ts = curr_time_step == num_steps
                         # Advance to the next phase
                         phase = self._next_phase(is_last_ts)
                         if enum_equal(phase, MGMT_COMMAND.STOP):
                             self.service_to_runtime.send(
-                                MGMT_RESPONSE.REQ_STOP)
+                                to_np(MGMT_RESPONSE.REQ_STOP))
                             break
                         if enum_equal(phase, MGMT_COMMAND.PAUSE):
                             self.service_to_runtime.send(
-                                MGMT_RESPONSE.REQ_PAUSE)
+                                to_np(MGMT_RESPONSE.REQ_PAUSE))
                             break
                         # Increase time step if spiking phase
                         if enum_equal(phase, LoihiPhase.SPK):
@@ -349,9 +350,10 @@ class LoihiPyRuntimeService(PyRuntimeService):
                             if self._error:
                                 # Forward error to runtime
                                 self.service_to_runtime.send(
-                                    MGMT_RESPONSE.ERROR)
+                                    to_np(MGMT_RESPONSE.ERROR))
                                 # stop all other pm
-                                self._send_pm_cmd(MGMT_COMMAND.STOP)
+                                self._send_pm_cmd(
+                                    to_np(MGMT_COMMAND.STOP))
                                 return
                         # Check if pause or stop received from Runtime
                         # TODO: Do we actualy need to wait for PMs to be in
@@ -376,9 +378,10 @@ class LoihiPyRuntimeService(PyRuntimeService):
                             enum_equal(phase, MGMT_COMMAND.PAUSE):
                         continue
                     # Inform the runtime that last time step was reached
-                    self.service_to_runtime.send(MGMT_RESPONSE.DONE)
+                    self.service_to_runtime.send(
+                        to_np(MGMT_RESPONSE.DONE))
             else:
-                self.service_to_runtime.send(MGMT_RESPONSE.ERROR)
+                self.service_to_runtime.send(to_np(MGMT_RESPONSE.ERROR))
 
     def _handle_get_set(self, phase, command):
         if enum_equal(phase, LoihiPhase.HOST):
@@ -431,7 +434,7 @@ class AsyncPyRuntimeService(PyRuntimeService):
         REQ_STOP = enum_to_np(-5)
         """Signifies Request of STOP"""
 
-    def _send_pm_cmd(self, cmd: MGMT_COMMAND):
+    def _send_pm_cmd(self, cmd: np.ndarray):
         for stop_send_port in self.service_to_process:
             stop_send_port.send(cmd)
 
@@ -443,19 +446,19 @@ class AsyncPyRuntimeService(PyRuntimeService):
 
     def _handle_pause(self):
         # Inform the runtime about successful pausing
-        self.service_to_runtime.send(MGMT_RESPONSE.PAUSED)
+        self.service_to_runtime.send(to_np(MGMT_RESPONSE.PAUSED))
 
     def _handle_stop(self):
-        self._send_pm_cmd(MGMT_COMMAND.STOP)
+        self._send_pm_cmd(to_np(MGMT_COMMAND.STOP))
         rsps = self._get_pm_resp()
         for rsp in rsps:
             if not enum_equal(rsp,
                               LoihiPyRuntimeService.PMResponse.STATUS_TERMINATED
                               ):
-                self.service_to_runtime.send(MGMT_RESPONSE.ERROR)
+                self.service_to_runtime.send(to_np(MGMT_RESPONSE.ERROR))
                 raise ValueError(f"Wrong Response Received : {rsp}")
         # Inform the runtime about successful termination
-        self.service_to_runtime.send(MGMT_RESPONSE.TERMINATED)
+        self.service_to_runtime.send(to_np(MGMT_RESPONSE.TERMINATED))
         self.join()
 
     def run(self):
@@ -475,7 +478,7 @@ class AsyncPyRuntimeService(PyRuntimeService):
                 elif enum_equal(command, MGMT_COMMAND.PAUSE):
                     self._handle_pause()
                 else:
-                    self._send_pm_cmd(MGMT_COMMAND.RUN)
+                    self._send_pm_cmd(to_np(MGMT_COMMAND.RUN))
                     for ptos_recv_port in self.process_to_service:
                         channel_actions.append((ptos_recv_port,
                                                 lambda: 'resp'))
@@ -493,13 +496,16 @@ class AsyncPyRuntimeService(PyRuntimeService):
                                   ):
                         self._error = True
                 if self.req_stop:
-                    self.service_to_runtime.send(MGMT_RESPONSE.REQ_STOP)
+                    self.service_to_runtime.send(
+                        to_np(MGMT_RESPONSE.REQ_STOP))
                 if self.req_pause:
-                    self.service_to_runtime.send(MGMT_RESPONSE.REQ_PAUSE)
+                    self.service_to_runtime.send(
+                        to_np(MGMT_RESPONSE.REQ_PAUSE))
                 if self._error:
-                    self.service_to_runtime.send(MGMT_RESPONSE.ERROR)
+                    self.service_to_runtime.send(
+                        to_np(MGMT_RESPONSE.ERROR))
             else:
-                self.service_to_runtime.send(MGMT_RESPONSE.ERROR)
+                self.service_to_runtime.send(to_np(MGMT_RESPONSE.ERROR))
                 raise ValueError(f"Wrong type of channel action : {action}")
             channel_actions.append((self.runtime_to_service, lambda: 'cmd'))
 
@@ -567,13 +573,15 @@ class NxSdkRuntimeService(NcRuntimeService):
                 if enum_equal(command, MGMT_COMMAND.STOP):
                     self.board.stop()
 
-                    self.service_to_runtime.send(MGMT_RESPONSE.TERMINATED)
+                    self.service_to_runtime.send(
+                        to_np(MGMT_RESPONSE.TERMINATED))
                     self.join()
                     return
                 elif enum_equal(command, MGMT_COMMAND.PAUSE):
                     self.board.pause()
 
-                    self.service_to_runtime.send(MGMT_RESPONSE.PAUSED)
+                    self.service_to_runtime.send(
+                        to_np(MGMT_RESPONSE.PAUSED))
                     break
                 # If message recieved from Runtime is greater than zero
                 # it is the num_steps for a run, use num_steps to start
@@ -584,7 +592,9 @@ class NxSdkRuntimeService(NcRuntimeService):
                     self.num_steps = command
                     self.board.run(numSteps=self.num_steps, aSync=False)
 
-                    self.service_to_runtime.send(MGMT_RESPONSE.DONE)
+                    self.service_to_runtime.send(
+                        to_np(MGMT_RESPONSE.DONE))
                 else:
-                    self.service_to_runtime.send(MGMT_RESPONSE.ERROR)
+                    self.service_to_runtime.send(
+                        to_np(MGMT_RESPONSE.ERROR))
                     return
@@ -2,6 +2,15 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # See: https://spdx.org/licenses/
 
-from . import reset, source, sink, dataloader
+import importlib
 
 __all__ = ['reset', 'source', 'sink', 'dataloader']
+
+
+def __getattr__(name: str):
+    """Imports the io submodules lazily on first attribute access."""
+    if name in __all__:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
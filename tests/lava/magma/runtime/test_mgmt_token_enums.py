@@ -0,0 +1,66 @@
+# Copyright (C) 2021 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+# See: https://spdx.org/licenses/
+import unittest
+
+import numpy as np
+
+from lava.magma.runtime.mgmt_token_enums import (
+    enum_to_np,
+    enum_equal,
+    enum_equal_scalar,
+    to_np,
+    MGMT_COMMAND,
+    MGMT_RESPONSE,
+)
+
+
+class TestMgmtTokenEnums(unittest.TestCase):
+    def test_enum_to_np_is_cached_and_read_only(self):
+        """Tests that repeated conversions share one read-only array"""
+        token = enum_to_np(5)
+        self.assertIs(token, enum_to_np(5))
+        self.assertEqual(token.shape, (1,))
+        self.assertFalse(token.flags.writeable)
+
+    def test_enum_to_np_unhashable_value(self):
+        """Tests conversion of 0-d arrays as yielded by np.nditer"""
+        for value in np.nditer(np.arange(3.0)):
+            token = enum_to_np(value, np.float64)
+            self.assertEqual(token.shape, (1,))
+            self.assertEqual(token[0], value)
+
+    def test_enum_to_np_float_data_is_not_cached(self):
+        """Tests that float data keeps its value, e.g. the sign of -0.0"""
+        enum_to_np(0, np.float64)
+        token = enum_to_np(np.float64(-0.0), np.float64)
+        self.assertTrue(np.signbit(token[0]))
+        self.assertIsNot(token, enum_to_np(np.float64(-0.0), np.float64))
+        self.assertTrue(token.flags.writeable)
+
+    def test_to_np(self):
+        """Tests the precomputed channel arrays of MGMT tokens"""
+        for token in list(MGMT_COMMAND) + list(MGMT_RESPONSE):
+            arr = to_np(token)
+            self.assertEqual(arr.shape, (1,))
+            self.assertEqual(arr[0], token)
+
+    def test_enum_equal(self):
+        """Tests comparison of array, int and numpy scalar tokens"""
+        stop = MGMT_COMMAND.STOP
+        for a in (to_np(stop), int(stop), np.int32(stop), np.float64(stop)):
+            for b in (to_np(stop), stop, np.int32(stop)):
+                self.assertTrue(enum_equal(a, b))
+        self.assertFalse(enum_equal(to_np(stop), MGMT_COMMAND.PAUSE))
+        self.assertFalse(enum_equal(np.int32(stop), MGMT_COMMAND.RUN))
+
+    def test_enum_equal_scalar(self):
+        """Tests comparison of scalar tokens as received from a channel"""
+        received = to_np(MGMT_COMMAND.STOP)[0]
+        self.assertTrue(enum_equal_scalar(received, MGMT_COMMAND.STOP))
+        self.assertFalse(enum_equal_scalar(received, MGMT_COMMAND.PAUSE))
+        self.assertTrue(enum_equal_scalar(5, np.float64(5)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,12 @@
 # Copyright (C) 2021 Intel Corporation
 # SPDX-License-Identifier: BSD-3-Clause
 # See: https://spdx.org/licenses/
+from __future__ import annotations
+
+import logging
 import sys
 import unittest
 import numpy as np
-from typing import Tuple
 
 from lava.magma.core.run_configs import Loihi1SimCfg
 from lava.magma.core.run_conditions import RunSteps
@@ -12,22 +14,67 @@ from lava.proc.sdn.process import Sigma, SigmaDelta, ACTIVATION_MODE
 from lava.proc import io
 
 
-verbose = True if (('-v' in sys.argv) or ('--verbose' in sys.argv)) else False
+_VERBOSE = any(flag in sys.argv for flag in ('-v', '--verbose'))
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG if _VERBOSE else logging.WARNING)
+if _VERBOSE:
+    log.addHandler(logging.StreamHandler(sys.stdout))
+
+
+def sin_input(num_steps: int) -> np.ndarray:
+    """Sinusoid input of shape (1, num_steps) computed in a single buffer."""
+    x = np.arange(num_steps, dtype=np.float64).reshape(1, -1)
+    np.multiply(x, 0.1, out=x)
+    np.sin(x, out=x)
+    return x
+
+
+def back_diff(x: np.ndarray) -> np.ndarray:
+    """Backward difference along time, keeping the first sample as is.
+
+    The result is written into a single new array of the dtype of x. Input
+    and output do not overlap, so unlike ``x[:, 1:] -= x[:, :-1]`` NumPy
+    needs no temporary copy of the overlapping slice.
+    """
+    diff = np.empty_like(x)
+    diff[:, 0] = x[:, 0]
+    np.subtract(x[:, 1:], x[:, :-1], out=diff[:, 1:])
+    return diff
+
+
+def max_abs_cumsum_error(a: np.ndarray, b: np.ndarray) -> float:
+    """Max absolute error between the cumulative sums of a and b over time.
+
+    Uses ``cumsum(a) - cumsum(b) == cumsum(a - b)`` so that a single buffer
+    is accumulated in place instead of two cumulative sums.
+    """
+    error = np.subtract(a, b, dtype=np.float64)
+    np.cumsum(error, axis=1, out=error)
+    np.abs(error, out=error)
+    return error.max()
 
 
 class TestSigmaModels(unittest.TestCase):
     """Tests for sigma decoding"""
 
+    num_steps = 100
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Computes the differential sinusoid inputs once for all tests."""
+        input = sin_input(cls.num_steps)
+        # back_diff keeps the np.int32 data type of the fixed point RingBuffer
+        fixed_input = (input * (1 << 12)).astype(np.int32)
+        cls.inputs = {'floating_pt': back_diff(input),
+                      'fixed_pt': back_diff(fixed_input)}
+
     def run_test(
         self,
         num_steps: int,
         tag: str = 'fixed_pt'
-    ) -> Tuple[np.ndarray, np.ndarray]:
-        input = np.sin(0.1 * np.arange(num_steps).reshape(1, -1))
-        if tag == 'fixed_pt':
-            input *= (1 << 12)
-            input = input.astype(int)
-        input[:, 1:] -= input[:, :-1]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        self.assertLessEqual(num_steps, self.num_steps)
+        input = self.inputs[tag][:, :num_steps]
 
         source = io.source.RingBuffer(data=input)
         sigma = Sigma(shape=(1,))
@@ -47,7 +94,7 @@ class TestSigmaModels(unittest.TestCase):
 
     def test_sigma_decoding_fixed(self) -> None:
         """Test sigma decoding with cumulative sum."""
-        num_steps = 100
+        num_steps = self.num_steps
 
         input, output = self.run_test(
             num_steps=num_steps,
@@ -56,13 +103,12 @@ class TestSigmaModels(unittest.TestCase):
 
         error = np.abs(np.cumsum(input, axis=1) - output).max()
 
-        if verbose:
-            print(f'Max abs error = {error}')
+        log.debug('Max abs error = %s', error)
         self.assertTrue(error == 0)
 
     def test_sigma_decoding_float(self) -> None:
         """Test sigma decoding with cumulative sum."""
-        num_steps = 100
+        num_steps = self.num_steps
 
         input, output = self.run_test(
             num_steps=num_steps,
@@ -71,14 +117,40 @@ class TestSigmaModels(unittest.TestCase):
 
         error = np.abs(np.cumsum(input, axis=1) - output).max()
 
-        if verbose:
-            print(f'Max abs error = {error}')
+        log.debug('Max abs error = %s', error)
         self.assertTrue(error < 1e-6)
 
 
 class TestSigmaDeltaModels(unittest.TestCase):
     """Tests for sigma delta neuron"""
 
+    num_steps = 100
+
+    # Fixed point thresholds are scaled by 2**(wgt_exp + state_exp)
+    cases = {
+        'fixed': dict(vth=10 << 12, act_mode=ACTIVATION_MODE.Unit,
+                      wgt_exp=6, state_exp=6, cum_error=False),
+        'float': dict(vth=10, act_mode=ACTIVATION_MODE.Unit,
+                      wgt_exp=0, state_exp=0, cum_error=False,
+                      tag='floating_pt'),
+        'cum_error_fixed': dict(vth=10 << 12, act_mode=ACTIVATION_MODE.Unit,
+                                wgt_exp=6, state_exp=6, cum_error=True),
+        'cum_error_float': dict(vth=10, act_mode=ACTIVATION_MODE.Unit,
+                                wgt_exp=0, state_exp=0, cum_error=True,
+                                tag='floating_pt'),
+        'relu_fixed': dict(vth=10, act_mode=ACTIVATION_MODE.ReLU,
+                           wgt_exp=0, state_exp=0, cum_error=False),
+        'relu_float': dict(vth=10, act_mode=ACTIVATION_MODE.ReLU,
+                           wgt_exp=0, state_exp=0, cum_error=False,
+                           tag='floating_pt'),
+    }
+    """Sigma delta reconstruction test cases, keyed by name"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Computes the sinusoid input once for all tests."""
+        cls.sin_ramp = sin_input(cls.num_steps)
+
     def run_test(
         self,
         num_steps: int,
@@ -88,12 +160,19 @@ class TestSigmaDeltaModels(unittest.TestCase):
         state_exp: int,
         cum_error: bool,
         tag: str = 'fixed_pt',
-    ) -> Tuple[np.ndarray, np.ndarray]:
-        input = np.sin(0.1 * np.arange(num_steps).reshape(1, -1))
-        input *= (1 << wgt_exp + state_exp)
-        input[:, 1:] -= input[:, :-1]
-
-        source = io.source.RingBuffer(data=input.astype(int) * (1 << 6))
+    ) -> tuple[np.ndarray, np.ndarray]:
+        self.assertLessEqual(num_steps, self.num_steps)
+        scale = 1 << (wgt_exp + state_exp)
+        input = back_diff(self.sin_ramp[:, :num_steps] * scale)
+
+        # Truncate to 32 bit integers, the RingBuffer fixed point data type,
+        # and scale by 2**6 in place
+        self.assertLessEqual(np.abs(input).max(),
+                             np.iinfo(np.int32).max >> 6)
+        data = input.astype(np.int32)
+        data <<= 6
+
+        source = io.source.RingBuffer(data=data)
         sdn = SigmaDelta(
             shape=(1,),
             vth=vth,
@@ -114,148 +193,46 @@ class TestSigmaDeltaModels(unittest.TestCase):
         output = sink.data.get()
         sdn.stop()
 
-        input = np.cumsum(input, axis=1)
-        output = np.cumsum(output, axis=1)
-
         return input, output
 
-    def test_reconstruction_fixed(self) -> None:
-        """Tests fixed point sigma delta reconstruction. The max absolute
-        error must be smaller than threshold.
+    def check_reconstruction(self, name: str) -> None:
+        """Runs the test case of the given name. The max absolute error of
+        the reconstruction must be smaller than threshold.
         """
-        num_steps = 100
-        wgt_exp = 6
-        state_exp = 6
-        vth = 10 << (wgt_exp + state_exp)
-        input, output = self.run_test(
-            num_steps=num_steps,
-            vth=vth,
-            act_mode=ACTIVATION_MODE.Unit,
-            wgt_exp=wgt_exp,
-            state_exp=state_exp,
-            cum_error=False,
-        )
+        case = self.cases[name]
+        input, output = self.run_test(num_steps=self.num_steps, **case)
 
-        error = np.abs(input - output).max()
+        if case['act_mode'] == ACTIVATION_MODE.ReLU:
+            error = np.abs(np.maximum(np.cumsum(input, axis=1), 0)
+                           - np.cumsum(output, axis=1)).max()
+        else:
+            error = max_abs_cumsum_error(input, output)
 
-        if verbose:
-            print(f'Max abs error = {error}')
-        self.assertTrue(error < vth * (1 << wgt_exp))
+        log.debug('Max abs error = %s', error)
+        self.assertTrue(error < case['vth'] * (1 << case['wgt_exp']))
 
-    def test_reconstruction_float(self) -> None:
-        """Tests floating point sigma delta reconstruction. The max absolute
-        error must be smaller than threshold.
-        """
-        num_steps = 100
-        wgt_exp = 0
-        state_exp = 0
-        vth = 10
-        input, output = self.run_test(
-            num_steps=num_steps,
-            vth=vth,
-            act_mode=ACTIVATION_MODE.Unit,
-            wgt_exp=wgt_exp,
-            state_exp=state_exp,
-            cum_error=False,
-            tag='floating_pt'
-        )
-
-        error = np.abs(input - output).max()
+    def test_reconstruction_fixed(self) -> None:
+        """Tests fixed point sigma delta reconstruction."""
+        self.check_reconstruction('fixed')
 
-        if verbose:
-            print(f'Max abs error = {error}')
-        self.assertTrue(error < vth * (1 << wgt_exp))
+    def test_reconstruction_float(self) -> None:
+        """Tests floating point sigma delta reconstruction."""
+        self.check_reconstruction('float')
 
     def test_reconstruction_cum_error_fixed(self) -> None:
-        """Tests fixed point sigma delta reconstruction with cumulative error.
-        The max absolute error must be smaller than threshold.
-        """
-        num_steps = 100
-        wgt_exp = 6
-        state_exp = 6
-        vth = 10 << (wgt_exp + state_exp)
-        input, output = self.run_test(
-            num_steps=num_steps,
-            vth=vth,
-            act_mode=ACTIVATION_MODE.Unit,
-            wgt_exp=wgt_exp,
-            state_exp=state_exp,
-            cum_error=True,
-        )
-
-        error = np.abs(input - output).max()
-
-        if verbose:
-            print(f'Max abs error = {error}')
-        self.assertTrue(error < vth * (1 << wgt_exp))
+        """Tests fixed point sigma delta reconstruction with cumulative
+        error."""
+        self.check_reconstruction('cum_error_fixed')
 
     def test_reconstruction_cum_error_float(self) -> None:
         """Tests floating point sigma delta reconstruction with cumulative
-        error. The max absolute error must be smaller than threshold.
-        """
-        num_steps = 100
-        wgt_exp = 0
-        state_exp = 0
-        vth = 10
-        input, output = self.run_test(
-            num_steps=num_steps,
-            vth=vth,
-            act_mode=ACTIVATION_MODE.Unit,
-            wgt_exp=wgt_exp,
-            state_exp=state_exp,
-            cum_error=True,
-            tag='floating_pt'
-        )
-
-        error = np.abs(input - output).max()
-
-        if verbose:
-            print(f'Max abs error = {error}')
-        self.assertTrue(error < vth * (1 << wgt_exp))
+        error."""
+        self.check_reconstruction('cum_error_float')
 
     def test_reconstruction_relu_fixed(self) -> None:
-        """Tests fixed point sigma delta reconstruction with ReLU.
-        The max absolute error must be smaller than threshold.
-        """
-        num_steps = 100
-        wgt_exp = 0
-        state_exp = 0
-        vth = 10 << (wgt_exp + state_exp)
-        input, output = self.run_test(
-            num_steps=num_steps,
-            vth=vth,
-            act_mode=ACTIVATION_MODE.ReLU,
-            wgt_exp=wgt_exp,
-            state_exp=state_exp,
-            cum_error=False,
-        )
-
-        error = np.abs(np.maximum(input, 0) - output).max()
-
-        if verbose:
-            print(f'Max abs error = {error}')
-        self.assertTrue(error < vth * (1 << wgt_exp))
+        """Tests fixed point sigma delta reconstruction with ReLU."""
+        self.check_reconstruction('relu_fixed')
 
     def test_reconstruction_relu_float(self) -> None:
-        """Tests floating point sigma delta reconstruction with ReLU.
-        The max absolute error must be smaller than threshold.
-        """
-        num_steps = 100
-        vth = 10
-        wgt_exp = 0
-        state_exp = 0
-        input, output = self.run_test(
-            num_steps=num_steps,
-            vth=vth,
-            act_mode=ACTIVATION_MODE.ReLU,
-            wgt_exp=wgt_exp,
-            state_exp=state_exp,
-            cum_error=False,
-            tag='floating_pt',
-        )
-
-        error = np.abs(np.maximum(input, 0) - output).max()
-
-        if verbose:
-            print(f'Max abs error = {error}')
-        self.assertTrue(error < vth * (1 << wgt_exp))
+        """Tests floating point sigma delta reconstruction with ReLU."""
+        self.check_reconstruction('relu_float')